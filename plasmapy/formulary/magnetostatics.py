@@ -10,6 +10,7 @@ __all__ = [
     "MagneticDipole",
     "MagnetoStatics",
     "Wire",
+    "WireSet",
 ]
 
 import abc
@@ -19,10 +20,208 @@ import numpy as np
 import scipy.special
 
 from astropy import constants
+from functools import lru_cache
 
 from plasmapy.utils.decorators import validate_quantities
 
 
+#: Largest number of (point, source element) pairs the field sums handle at
+#: once on the CPU.  Larger arrays of points are split into blocks so that
+#: the ``(..., n, 3)`` temporaries stay small enough to be cache resident.
+_BLOCK_SIZE = 2 ** 14
+
+#: As `_BLOCK_SIZE`, for the sums on a GPU.  The blocks only bound the
+#: memory of the temporaries, about 400 MB each in double precision, and
+#: are large enough that kernel launches do not dominate.
+_GPU_BLOCK_SIZE = 2 ** 24
+
+
+def _in_blocks(field, p, n, xp=np):
+    """
+    Evaluate ``field`` on blocks of the points ``p``, of shape ``(..., 3)``,
+    small enough that each block pairs at most `_BLOCK_SIZE` points and
+    source elements when there are ``n`` of the latter, or at most
+    `_GPU_BLOCK_SIZE` when ``xp`` is ``cupy``.
+    """
+    p = xp.asarray(p)
+    shape = p.shape
+    p = p.reshape(-1, 3)
+    block_size = _BLOCK_SIZE if xp is np else _GPU_BLOCK_SIZE
+    block = max(1, block_size // n)
+    if p.shape[0] <= block:
+        return field(p).reshape(shape)
+    B = xp.concatenate([field(p[i : i + block]) for i in range(0, p.shape[0], block)])
+    return B.reshape(shape)
+
+
+@lru_cache(maxsize=16)
+def _cached_roots(n):
+    """
+    Gauss-Legendre nodes and weights of order ``n``, shared between wires.
+
+    The arrays are made read-only so that no caller can corrupt the cache.
+    """
+    x, w = scipy.special.roots_legendre(n)
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+def _import_cupy():
+    """Import ``cupy``, raising a helpful `ImportError` if it is missing."""
+    try:
+        import cupy
+    except (ImportError, ModuleNotFoundError) as e:
+        from plasmapy.optional_deps import cupy_import_error
+
+        raise cupy_import_error from e
+
+    return cupy
+
+
+def _position_value(p):
+    """
+    Return the position ``p`` without units, converting it to meters if it
+    is a `~astropy.units.Quantity`.  Other inputs are taken to be in meters.
+    """
+    if isinstance(p, u.Quantity):
+        return p.to_value(u.m)
+    return p
+
+
+def _cross3(a, b, xp=np):
+    """
+    Cross product of three-component vectors stored along the last axis,
+    broadcasting over any leading axes.
+
+    Writing out the components avoids the general-purpose machinery of
+    `numpy.cross`, which dominates the cost for single vectors.
+    """
+    return xp.stack(
+        [
+            a[..., 1] * b[..., 2] - a[..., 2] * b[..., 1],
+            a[..., 2] * b[..., 0] - a[..., 0] * b[..., 2],
+            a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0],
+        ],
+        axis=-1,
+    )
+
+
+def _norm3(v, xp=np):
+    """Euclidean norm of three-component vectors stored along the last axis."""
+    return xp.sqrt(
+        v[..., 0] * v[..., 0] + v[..., 1] * v[..., 1] + v[..., 2] * v[..., 2]
+    )
+
+
+def _evaluate_curve(curve, t):
+    """
+    Evaluate ``curve`` at every parameter value in the array ``t`` and
+    return the positions as a ``(3, t.size)`` array.
+
+    ``curve`` is called once on the whole array when it supports
+    vectorized evaluation, and once per element otherwise.
+    """
+    try:
+        pts = np.asarray(curve(t), dtype=float)
+    except (TypeError, ValueError):
+        pts = None
+
+    if pts is None or pts.shape != (3, t.size):
+        pts = np.stack([np.asarray(curve(ti), dtype=float) for ti in t], axis=1)
+    return pts
+
+
+def _circle_curve(t, radius, center, axis_x, axis_y):
+    """
+    Positions on the circle of the given ``radius`` and ``center`` spanned
+    by the unit vectors ``axis_x`` and ``axis_y``, at the angles in the
+    array ``t``, as a ``(3, t.size)`` array.
+    """
+    return radius * (
+        np.outer(axis_x, np.cos(t)) + np.outer(axis_y, np.sin(t))
+    ) + np.expand_dims(center, 1)
+
+
+def _straight_segments_field(p1, p2, p, w=None, xp=np):
+    r"""
+    Sum the closed-form fields, in units of :math:`\mu_0 I / 4\pi`, of the
+    straight segments running from each row of the ``(n, 3)`` array ``p1``
+    to the matching row of ``p2``, each scaled by the matching entry of
+    the ``(n,)`` array ``w`` if it is given.  ``p`` has shape ``(..., 3)``
+    and so does the result.
+
+    With :math:`\vec d = \vec p_2 - \vec p_1`, :math:`\vec a = \vec p - \vec p_1`
+    and :math:`\vec b = \vec p - \vec p_2`, each segment contributes
+
+    .. math::
+
+        \frac{\vec d \times \vec a}{|\vec d \times \vec a|^2}
+        \left(\frac{\vec a \cdot \vec d}{|\vec a|}
+        - \frac{\vec b \cdot \vec d}{|\vec b|}\right)
+
+    which is the `FiniteStraightWire` field written without the foot of
+    the perpendicular.  ``xp`` is the array module, `numpy` or ``cupy``,
+    that the sum is computed with.
+    """
+    p1, p2 = xp.asarray(p1), xp.asarray(p2)
+    d = p2 - p1  # (n, 3)
+    if w is not None:
+        w = xp.asarray(w)
+
+    def field(p):
+        a = xp.expand_dims(p, -2) - p1  # (m, n, 3)
+        b = xp.expand_dims(p, -2) - p2  # (m, n, 3)
+        d_cross_a = _cross3(d, a, xp)
+        # p on an end point gives 0 / 0 here, masked out below
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_diff = xp.einsum("...ij,ij->...i", a, d) / _norm3(a, xp) - xp.einsum(
+                "...ij,ij->...i", b, d
+            ) / _norm3(b, xp)
+        d_cross_a2 = xp.einsum("...i,...i->...", d_cross_a, d_cross_a)
+
+        # a segment of zero length, or one whose line passes through p,
+        # contributes nothing, which is the limit of the closed form
+        nonzero = d_cross_a2 != 0
+        weight = xp.where(nonzero, cos_diff, 0) / xp.where(nonzero, d_cross_a2, 1)
+        if w is not None:
+            weight *= w
+        return xp.einsum("...ij,...i->...j", d_cross_a, weight)
+
+    return _in_blocks(field, p, d.shape[0], xp)
+
+
+def _biot_savart_quadrature(pt, dl, w, p, xp=np):
+    r"""
+    Weighted sum :math:`\sum_i w_i \, d\vec l_i \times \vec R_i / |\vec R_i|^3`
+    with :math:`\vec R_i = \vec p - \vec l_i`, for quadrature nodes ``pt``
+    and line elements ``dl`` given as ``(n, 3)`` arrays and weights ``w`` of
+    shape ``(n,)``.  ``p`` has shape ``(..., 3)`` and so does the result.
+    ``xp`` is the array module, `numpy` or ``cupy``, that the sum is
+    computed with.
+    """
+    pt, dl, w = xp.asarray(pt), xp.asarray(dl), xp.asarray(w)
+    dx, dy, dz = dl[:, 0], dl[:, 1], dl[:, 2]
+
+    def field(p):
+        r = xp.expand_dims(p, -2) - pt  # (m, n, 3)
+
+        # fold 1/|r|^3 into the weights and contract each cross product
+        # component with them directly, so no (m, n, 3) integrand is formed
+        weight = w * xp.einsum("...i,...i->...", r, r) ** -1.5  # (m, n)
+        x, y, z = r[..., 0], r[..., 1], r[..., 2]
+        return xp.stack(
+            [
+                xp.einsum("...i,...i->...", dy * z - dz * y, weight),
+                xp.einsum("...i,...i->...", dz * x - dx * z, weight),
+                xp.einsum("...i,...i->...", dx * y - dy * x, weight),
+            ],
+            axis=-1,
+        )
+
+    return _in_blocks(field, p, pt.shape[0], xp)
+
+
 class MagnetoStatics(abc.ABC):
     """Abstract class for all kinds of magnetic static fields"""
 
@@ -34,12 +233,14 @@ class MagnetoStatics(abc.ABC):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the same shape
+            as ``p``
 
         """
 
@@ -63,6 +264,7 @@ class MagneticDipole(MagnetoStatics):
         self._moment_u = moment.unit
         self.p0 = p0.value
         self._p0_u = p0.unit
+        self._k = constants.mu0.value / (4 * np.pi)
 
     def __repr__(self):
         return "{name}(moment={moment}{moment_u}, p0={p0}{p0_u})".format(
@@ -80,26 +282,32 @@ class MagneticDipole(MagnetoStatics):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the same shape
+            as ``p``
 
         """
+        return self._magnetic_field_value(_position_value(p)) * u.T
+
+    def _magnetic_field_value(self, p):
+        """Magnetic field in tesla as a plain array."""
         r = p - self.p0
         m = self.moment
-        B = (
-            constants.mu0.value
-            / 4
-            / np.pi
-            * (
-                3 * r * np.dot(m, r) / np.linalg.norm(r) ** 5
-                - m / np.linalg.norm(r) ** 3
-            )
-        )
-        return B * u.T
+        if r.ndim == 1:
+            # scalar products keep the per-call overhead of one point low
+            r2 = r @ r
+            r_m = r @ m
+        else:
+            r2 = np.einsum("...i,...i->...", r, r)[..., np.newaxis]
+            r_m = (r @ m)[..., np.newaxis]
+        # a single fractional power of |r|^2; no sqrt is needed
+        inv_r3 = r2 ** -1.5
+        return self._k * inv_r3 * (3 * r_m / r2 * r - m)
 
 
 class Wire(MagnetoStatics):
@@ -114,22 +322,32 @@ class GeneralWire(Wire):
     ----------
     parametric_eq: Callable
         A vector-valued (with units of position) function of a single real
-        parameter.
+        parameter.  If it accepts an array of parameter values and returns
+        an array of shape ``(3, len(t))``, the whole curve is evaluated in a
+        single call.
     t1: float
         lower bound of the parameter, smaller than t2
     t2: float
         upper bound of the parameter, larger than t1
     current: `astropy.units.Quantity`
         electric current
+    dparametric_eq: Callable, optional
+        Derivative of ``parametric_eq`` with respect to its parameter, used by
+        the ``"gauss"`` method of `magnetic_field`.  If not given, it is
+        approximated by central finite differences.
 
     """
 
     @validate_quantities
-    def __init__(self, parametric_eq, t1, t2, current: u.A):
+    def __init__(self, parametric_eq, t1, t2, current: u.A, dparametric_eq=None):
         if callable(parametric_eq):
             self.parametric_eq = parametric_eq
         else:
             raise ValueError("Argument parametric_eq should be a callable")
+        if dparametric_eq is None or callable(dparametric_eq):
+            self.dparametric_eq = dparametric_eq
+        else:
+            raise ValueError("Argument dparametric_eq should be a callable")
         if t1 < t2:
             self.t1 = t1
             self.t2 = t2
@@ -137,6 +355,7 @@ class GeneralWire(Wire):
             raise ValueError(f"t1={t1} is not smaller than t2={t2}")
         self.current = current.value
         self._current_u = current.unit
+        self._k = constants.mu0.value / (4 * np.pi) * self.current
 
     def __repr__(self):
         return (
@@ -151,52 +370,139 @@ class GeneralWire(Wire):
             )
         )
 
-    def magnetic_field(self, p: u.m, n: numbers.Integral = 1000) -> u.T:
+    def magnetic_field(
+        self,
+        p: u.m,
+        n: numbers.Integral = 1000,
+        method: str = "segments",
+        dtype=np.float64,
+    ) -> u.T:
         r"""
         Calculate magnetic field generated by this wire at position `p`
 
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
         n : int, optional
-            Number of segments for Wire calculation
-            (defaults to 1000)
+            Number of segments, or of quadrature nodes for ``method="gauss"``,
+            for Wire calculation (defaults to 1000)
+        method : str, optional
+            ``"segments"`` (default) sums the exact fields of ``n`` straight
+            segments inscribed in the curve, ``"gauss"`` integrates the
+            Biot-Savart law with ``n`` point Gauss-Legendre quadrature
+        dtype : `numpy.dtype`, optional
+            Floating point type the sum is computed in (defaults to
+            `numpy.float64`).  `numpy.float32` halves the memory traffic
+            on large arrays of points at the cost of precision.
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the same shape
+            as ``p``
 
         Notes
         -----
         For simplicity, we segment the wire into n equal pieces,
         and assume each segment is straight. Default n is 1000.
+        The field of each straight segment is known exactly (see
+        `FiniteStraightWire`), so with :math:`\vec a_i = \vec p - \vec l(t_{i-1})`,
+        :math:`\vec b_i = \vec p - \vec l(t_i)` and
+        :math:`\vec d_i = \vec l(t_i) - \vec l(t_{i-1})`
 
         .. math::
 
             \vec B
             \approx \frac{\mu_0 I}{4\pi} \sum_{i=1}^{n}
-            \frac{[\vec l(t_{i}) - \vec l(t_{i-1})] \times
-            \left[\vec p - \frac{\vec l(t_{i}) + \vec l(t_{i-1})}{2}\right]}
-            {\left|\vec p - \frac{\vec l(t_{i}) + \vec l(t_{i-1})}{2}\right|^3},
+            \frac{\vec d_i \times \vec a_i}{|\vec d_i \times \vec a_i|^2}
+            \left(\frac{\vec a_i \cdot \vec d_i}{|\vec a_i|}
+            - \frac{\vec b_i \cdot \vec d_i}{|\vec b_i|}\right),
             \quad \text{where}\, t_i = t_{\min}+i/n*(t_{\max}-t_{\min})
 
+        The result is the exact field of the inscribed polygon, which
+        converges to the field of the curve as :math:`1/n^2`.
+
+        With ``method="gauss"``, the Biot-Savart integral
+
+        .. math::
+
+            \vec B = \frac{\mu_0 I}{4\pi} \int_{t_{\min}}^{t_{\max}}
+            \frac{\vec l'(t) \times [\vec p - \vec l(t)]}{|\vec p - \vec l(t)|^3} dt
+
+        is evaluated with n points Gauss-Legendre quadrature, as in
+        `CircularWire`.  For smooth open curves this converges much faster
+        than the segment sum, so a few tens of nodes are usually enough.
+
         """
 
-        p1 = self.parametric_eq(self.t1)
-        step = (self.t2 - self.t1) / n
-        t = self.t1
-        B = 0
-        for i in range(n):
-            t = t + step
-            p2 = self.parametric_eq(t)
-            dl = p2 - p1
-            p1 = p2
-            R = p - (p2 + p1) / 2
-            B += np.cross(dl, R) / np.linalg.norm(R) ** 3
-        B = B * constants.mu0.value / 4 / np.pi * self.current
-        return B * u.T
+        return self._magnetic_field_value(_position_value(p), n, method, dtype) * u.T
+
+    def magnetic_field_gpu(
+        self,
+        p: u.m,
+        n: numbers.Integral = 1000,
+        method: str = "segments",
+        dtype=np.float64,
+    ) -> u.T:
+        """
+        Calculate magnetic field generated by this wire at position `p`
+        on a CUDA GPU with CuPy.
+
+        The wire is sampled on the CPU, and the sum over segments or
+        quadrature nodes for every point in ``p`` runs on the GPU.  This
+        pays off for large arrays of points.  Parameters and return value
+        are as for `magnetic_field`.
+        """
+        cp = _import_cupy()
+        p = cp.asarray(_position_value(p))
+        B = self._magnetic_field_value(p, n, method, dtype, xp=cp)
+        return cp.asnumpy(B) * u.T
+
+    def _magnetic_field_value(self, p, n, method, dtype, xp=np):
+        """Magnetic field in tesla as a plain array of the module ``xp``."""
+        p = xp.asarray(p, dtype=dtype)
+        if method == "segments":
+            p1, p2 = self._segments(n)
+            B = _straight_segments_field(p1.astype(dtype), p2.astype(dtype), p, xp=xp)
+        elif method == "gauss":
+            x, w = _cached_roots(n)
+            half_length = (self.t2 - self.t1) / 2
+            t = (self.t1 + self.t2) / 2 + half_length * x
+            pt = _evaluate_curve(self.parametric_eq, t).T  # (n, 3)
+            if self.dparametric_eq is not None:
+                dl = _evaluate_curve(self.dparametric_eq, t).T  # (n, 3)
+            else:
+                # central differences, (n, 3), with steps that stay within
+                # [t1, t2] around the outermost nodes
+                h = min(1e-5, (1 - x.max()) / 2) * half_length
+                dl = (
+                    _evaluate_curve(self.parametric_eq, t + h)
+                    - _evaluate_curve(self.parametric_eq, t - h)
+                ).T / (2 * h)
+            B = _biot_savart_quadrature(
+                pt.astype(dtype),
+                dl.astype(dtype),
+                (w * half_length).astype(dtype),
+                p,
+                xp,
+            )
+        else:
+            raise ValueError(f"method={method!r} is not one of 'segments' or 'gauss'")
+
+        # scale in place so that the result keeps ``dtype``
+        B *= self._k
+        return B
+
+    def _segments(self, n):
+        """
+        Start and end points, as two ``(n, 3)`` arrays, of the ``n`` straight
+        segments inscribed in the wire.
+        """
+        t = np.linspace(self.t1, self.t2, n + 1)
+        pts = _evaluate_curve(self.parametric_eq, t).T  # (n + 1, 3)
+        return pts[:-1], pts[1:]
 
 
 class FiniteStraightWire(Wire):
@@ -226,6 +532,12 @@ class FiniteStraightWire(Wire):
             raise ValueError("p1, p2 should not be the same point.")
         self.current = current.value
         self._current_u = current.unit
+        self._k = constants.mu0.value / (4 * np.pi) * self.current
+
+        # the direction vector and its length depend only on p1, p2
+        self._d = self.p2 - self.p1
+        self._d2 = np.dot(self._d, self._d)
+        self._d_norm = np.sqrt(self._d2)
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -244,12 +556,14 @@ class FiniteStraightWire(Wire):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the same shape
+            as ``p``
 
         Notes
         -----
@@ -263,39 +577,34 @@ class FiniteStraightWire(Wire):
                      \frac{\mu_0 I}{4\pi} (\cos\theta_1 - \cos\theta_2)
 
         """
+        return self._magnetic_field_value(_position_value(p)) * u.T
+
+    def _magnetic_field_value(self, p):
+        """Magnetic field in tesla as a plain array."""
         # foot of perpendicular
-        p1, p2 = self.p1, self.p2
-        p2_p1 = p2 - p1
-        ratio = np.dot(p - p1, p2_p1) / np.dot(p2_p1, p2_p1)
-        pf = p1 + p2_p1 * ratio
+        p1, p2, p2_p1 = self.p1, self.p2, self._d
+        dot_1 = np.dot(p - p1, p2_p1)
+        dot_2 = np.dot(p - p2, p2_p1)
+        ratio = dot_1 / self._d2
+        pf = p1 + p2_p1 * ratio[..., np.newaxis]
 
         # angles: theta_1 = <p - p1, p2 - p1>, theta_2 = <p - p2, p2 - p1>
-        cos_theta_1 = (
-            np.dot(p - p1, p2_p1) / np.linalg.norm(p - p1) / np.linalg.norm(p2_p1)
-        )
-        cos_theta_2 = (
-            np.dot(p - p2, p2_p1) / np.linalg.norm(p - p2) / np.linalg.norm(p2_p1)
-        )
+        cos_theta_1 = dot_1 / (_norm3(p - p1) * self._d_norm)
+        cos_theta_2 = dot_2 / (_norm3(p - p2) * self._d_norm)
 
-        B_unit = np.cross(p2_p1, p - pf)
-        B_unit = B_unit / np.linalg.norm(B_unit)
-
-        B = (
-            B_unit
-            / np.linalg.norm(p - pf)
-            * (cos_theta_1 - cos_theta_2)
-            * constants.mu0.value
-            / 4
-            / np.pi
-            * self.current
-        )
-
-        return B * u.T
+        # p - pf is perpendicular to p2 - p1, so the cross product has norm
+        # |p2 - p1| |p - pf| and needs no normalization of its own
+        r = p - pf
+        r2 = np.einsum("...i,...i->...", r, r)
+        scale = (cos_theta_1 - cos_theta_2) * self._k / (self._d_norm * r2)
+        return _cross3(p2_p1, r) * scale[..., np.newaxis]
 
     def to_GeneralWire(self):
         """Convert this `Wire` into a `GeneralWire`."""
         p1, p2 = self.p1, self.p2
-        return GeneralWire(lambda t: p1 + (p2 - p1) * t, 0, 1, self.current * u.A)
+        return GeneralWire(
+            lambda t: (p1 + np.multiply.outer(t, p2 - p1)).T, 0, 1, self.current * u.A
+        )
 
 
 class InfiniteStraightWire(Wire):
@@ -320,6 +629,7 @@ class InfiniteStraightWire(Wire):
         self._p0_u = p0.unit
         self.current = current.value
         self._current_u = current.unit
+        self._k = constants.mu0.value / (2 * np.pi) * self.current
 
     def __repr__(self):
         return "{name}(direction={direction}, p0={p0}{p0_u}, current={current}{current_u})".format(
@@ -338,12 +648,14 @@ class InfiniteStraightWire(Wire):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the same shape
+            as ``p``
 
         Notes
         -----
@@ -353,11 +665,141 @@ class InfiniteStraightWire(Wire):
             r\, \text{is the perpendicular distance between} P_0 \text{and the infinite wire}
 
         """
-        r = np.cross(self.direction, p - self.p0)
-        B_unit = r / np.linalg.norm(r)
-        r = np.linalg.norm(r)
+        return self._magnetic_field_value(_position_value(p)) * u.T
+
+    def _magnetic_field_value(self, p):
+        """Magnetic field in tesla as a plain array."""
+        # |r| is the distance to the wire, so B = k r / |r|^2
+        r = _cross3(self.direction, p - self.p0)
+        if r.ndim == 1:
+            r2 = r @ r
+        else:
+            r2 = np.einsum("...i,...i->...", r, r)[..., np.newaxis]
+        return r * (self._k / r2)
+
+
+class WireSet(Wire):
+    """
+    Set of straight wire segments, each with its own current, whose fields
+    are summed in a single pass.
+
+    The segments are stored as arrays rather than as separate `Wire`
+    objects, so superposing the fields of many wires on a grid of points
+    traverses the grid once.
+
+    Parameters
+    ----------
+    p1: `astropy.units.Quantity`
+        ``(N, 3)`` array of the starting points of the segments
+    p2: `astropy.units.Quantity`
+        ``(N, 3)`` array of the end points of the segments; p1 to p2 is the
+        positive current direction
+    current: `astropy.units.Quantity`
+        electric current in each segment, either one value for all of them
+        or an array of shape ``(N,)``
+
+    """
+
+    @validate_quantities
+    def __init__(self, p1: u.m, p2: u.m, current: u.A):
+        if p1.ndim != 2 or p1.shape[1] != 3 or p1.shape != p2.shape:
+            raise ValueError(
+                f"p1 and p2 should both have shape (N, 3), got {p1.shape} and "
+                f"{p2.shape}."
+            )
+        if np.any(np.all(p1 == p2, axis=-1)):
+            raise ValueError("p1, p2 should not be the same point in any segment.")
+        self.p1 = p1.value
+        self.p2 = p2.value
+        self._p1_u = p1.unit
+        self._p2_u = p2.unit
+        self.current = np.broadcast_to(current.value, p1.shape[:1]).copy()
+        self._current_u = current.unit
+        self._k = constants.mu0.value / (4 * np.pi) * self.current
+
+    @classmethod
+    def from_wires(cls, wires, n: numbers.Integral = 1000):
+        """
+        Collect the segments of several wires into one `WireSet`.
+
+        Parameters
+        ----------
+        wires : iterable of `Wire`
+            `FiniteStraightWire` objects are added as a single segment and
+            other `WireSet` objects segment by segment.
+            Any other wire that is a `GeneralWire` or can be converted to
+            one with ``to_GeneralWire``, such as `CircularWire`, is split
+            into ``n`` straight segments, as in
+            `GeneralWire.magnetic_field`.
+        n : int, optional
+            Number of segments for each curved wire (defaults to 1000)
 
-        return B_unit / r * constants.mu0.value / 2 / np.pi * self.current * u.T
+        """
+        p1, p2, current = [], [], []
+        for wire in wires:
+            if isinstance(wire, FiniteStraightWire):
+                p1.append(wire.p1[np.newaxis])
+                p2.append(wire.p2[np.newaxis])
+                current.append([wire.current])
+                continue
+            if isinstance(wire, WireSet):
+                p1.append(wire.p1)
+                p2.append(wire.p2)
+                current.append(wire.current)
+                continue
+
+            if not isinstance(wire, GeneralWire):
+                if not hasattr(wire, "to_GeneralWire"):
+                    raise TypeError(f"{wire!r} cannot be split into straight segments.")
+                wire = wire.to_GeneralWire()
+            wire_p1, wire_p2 = wire._segments(n)
+            p1.append(wire_p1)
+            p2.append(wire_p2)
+            current.append(np.full(n, wire.current))
+
+        return cls(
+            np.concatenate(p1) * u.m,
+            np.concatenate(p2) * u.m,
+            np.concatenate(current) * u.A,
+        )
+
+    def __repr__(self):
+        name = self.__class__.__name__
+        p1 = self.p1
+        p2 = self.p2
+        current = self.current
+        p1_u = self._p1_u
+        p2_u = self._p2_u
+        current_u = self._current_u
+        return f"{name}(p1={p1}{p1_u}, p2={p2}{p2_u}, current={current}{current_u})"
+
+    def magnetic_field(self, p) -> u.T:
+        r"""
+        Calculate magnetic field generated by all segments at position `p`
+
+        Parameters
+        ----------
+        p : `astropy.units.Quantity`
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
+
+        Returns
+        -------
+        B : `astropy.units.Quantity`
+            magnetic field at the specified positon, with the same shape
+            as ``p``
+
+        Notes
+        -----
+        The field is the sum of the closed-form fields of the segments,
+        as in `FiniteStraightWire`.
+
+        """
+        return self._magnetic_field_value(_position_value(p)) * u.T
+
+    def _magnetic_field_value(self, p):
+        """Magnetic field in tesla as a plain array."""
+        return _straight_segments_field(self.p1, self.p2, p, w=self._k)
 
 
 class CircularWire(Wire):
@@ -377,6 +819,11 @@ class CircularWire(Wire):
 
     """
 
+    #: Points closer to the axis than this fraction of the radius get the
+    #: on-axis field plus its first-order radial part; the terms left out
+    #: are of relative order ``(rho / radius) ** 2``, below the round-off.
+    _axis_rtol = 1e-8
+
     def __repr__(self):
         return (
             "{name}(normal={normal}, center={center}{center_u}, "
@@ -404,6 +851,7 @@ class CircularWire(Wire):
             raise ValueError("Radius should bu larger than 0")
         self.current = current.value
         self._current_u = current.unit
+        self._k = constants.mu0.value / (4 * np.pi) * self.current
 
         # parametric equation
         # find other two axises in the disc plane
@@ -420,43 +868,50 @@ class CircularWire(Wire):
 
         self.axis_x = axis_x
         self.axis_y = axis_y
+        # the quadrature runs the current from axis_x towards axis_y, so the
+        # field on the axis points along axis_x x axis_y; that is -normal
+        # when normal is -z and the fallback axes above are taken
+        self._axis = np.cross(axis_x, axis_y)
 
-        def curve(t):
-            if isinstance(t, np.ndarray):
-                t = np.expand_dims(t, 0)
-                axis_x_mat = np.expand_dims(axis_x, 1)
-                axis_y_mat = np.expand_dims(axis_y, 1)
-                return self.radius * (
-                    np.matmul(axis_x_mat, np.cos(t)) + np.matmul(axis_y_mat, np.sin(t))
-                ) + np.expand_dims(self.center, 1)
-            else:
-                return (
-                    self.radius * (np.cos(t) * axis_x + np.sin(t) * axis_y)
-                    + self.center
-                )
-
-        self.curve = curve
-
-        self.roots_legendre = scipy.special.roots_legendre(n)
+        self.roots_legendre = _cached_roots(n)
         self.n = n
 
-    def magnetic_field(self, p) -> u.T:
+        # quadrature nodes and line elements do not depend on the
+        # evaluation point, so compute them once
+        x, w = self.roots_legendre
+        self._t = x * np.pi
+        self._pt = _circle_curve(
+            self._t, self.radius, self.center, axis_x, axis_y
+        ).T  # (n, 3)
+        self._dl = self.radius * (
+            -np.outer(np.sin(self._t), axis_x) + np.outer(np.cos(self._t), axis_y)
+        )  # (n, 3)
+        self._w_pi = w * np.pi
+
+    def magnetic_field(self, p, dtype=np.float64) -> u.T:
         r"""
         Calculate magnetic field generated by this wire at position `p`
 
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of them with
+            shape ``(..., 3)``
+        dtype : `numpy.dtype`, optional
+            Floating point type the quadrature is computed in (defaults to
+            `numpy.float64`).  `numpy.float32` halves the memory traffic
+            on large arrays of points at the cost of precision.
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the same shape
+            as ``p``
 
         Notes
         -----
-        .. math:
+        .. math::
+
             \vec B
             = \frac{\mu_0 I}{4\pi}
             \int \frac{d\vec l\times(\vec p - \vec l(t))}{|\vec p - \vec l(t)|^3}\\
@@ -464,30 +919,74 @@ class CircularWire(Wire):
             \times \frac{\vec p - \vec l(t)}{|\vec p - \vec l(t)|^3} d\theta
 
         We use n points Gauss-Legendre quadrature to compute the integral. The default n is 300.
+        Points on the coil axis skip the quadrature and take the closed form,
+        expanded to first order in the distance :math:`\vec\rho` from the axis
+
+        .. math::
+
+            \vec B = \frac{\mu_0 I R^2}{2 (R^2 + z^2)^{3/2}}
+            \left(\hat n + \frac{3 z}{2 (R^2 + z^2)} \vec\rho\right)
 
         """
 
-        x, w = self.roots_legendre
-        t = x * np.pi
-        pt = self.curve(t)
-        dl = self.radius * (
-            -np.matmul(np.expand_dims(self.axis_x, 1), np.expand_dims(np.sin(t), 0))
-            + np.matmul(np.expand_dims(self.axis_y, 1), np.expand_dims(np.cos(t), 0))
-        )  # (3, n)
+        return self._magnetic_field_value(_position_value(p), dtype) * u.T
 
-        r = np.expand_dims(p, 1) - pt  # (3, n)
-        r_norm_3 = np.linalg.norm(r, axis=0) ** 3
-        ft = np.cross(dl, r, axisa=0, axisb=0) / np.expand_dims(r_norm_3, 1)  # (n, 3)
+    def magnetic_field_gpu(self, p: u.m, dtype=np.float64) -> u.T:
+        """
+        Calculate magnetic field generated by this wire at position `p`
+        on a CUDA GPU with CuPy.
 
-        return (
-            np.pi
-            * np.matmul(np.expand_dims(w, 0), ft).squeeze(0)
-            * constants.mu0.value
-            / 4
-            / np.pi
-            * self.current
-            * u.T
+        The quadrature sum for every point in ``p`` runs on the GPU, which
+        pays off for large arrays of points.  Parameters and return value
+        are as for `magnetic_field`.
+        """
+        cp = _import_cupy()
+        B = self._magnetic_field_value(cp.asarray(_position_value(p)), dtype, xp=cp)
+        return cp.asnumpy(B) * u.T
+
+    def _magnetic_field_value(self, p, dtype, xp=np):
+        """Magnetic field in tesla as a plain array of the module ``xp``."""
+        p = xp.asarray(p, dtype=dtype)
+        shape = p.shape
+        p = p.reshape(-1, 3)
+        normal = xp.asarray(self._axis, dtype=dtype)
+        d = p - xp.asarray(self.center, dtype=dtype)
+        z = d @ normal
+        d_perp = d - z[:, None] * normal
+        rho2 = xp.einsum("ij,ij->i", d_perp, d_perp)
+        on_axis = rho2 < (self._axis_rtol * self.radius) ** 2
+
+        B = xp.empty_like(p)
+        R2 = self.radius ** 2
+        z_on = z[on_axis]
+        r2_on = R2 + z_on ** 2
+        B_axis = 2 * np.pi * self._k * R2 / r2_on ** 1.5
+        # B_rho = -rho / 2 * dB_axis / dz
+        B[on_axis] = B_axis[:, None] * (
+            normal + (1.5 * z_on / r2_on)[:, None] * d_perp[on_axis]
+        )
+
+        off_axis = ~on_axis
+        if off_axis.any():
+            pt, dl, w_pi = (
+                a.astype(dtype, copy=False) for a in (self._pt, self._dl, self._w_pi)
+            )
+            B_off = _biot_savart_quadrature(pt, dl, w_pi, p[off_axis], xp)
+            # scale in place so that the result keeps ``dtype``
+            B_off *= self._k
+            B[off_axis] = B_off
+        return B.reshape(shape)
+
+    def curve(self, t):
+        """
+        Parametric equation of the coil: position at angle ``t`` from
+        ``axis_x`` towards ``axis_y``, with shape ``(3,) + np.shape(t)``.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        pts = _circle_curve(
+            np.atleast_1d(t), self.radius, self.center, self.axis_x, self.axis_y
         )
+        return pts.reshape((3,) + t.shape)
 
     def to_GeneralWire(self):
         """Convert this `Wire` into a `GeneralWire`."""
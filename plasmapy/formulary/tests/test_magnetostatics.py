@@ -4,12 +4,14 @@ import pytest
 from astropy import constants
 from astropy import units as u
 
+from plasmapy.formulary import magnetostatics
 from plasmapy.formulary.magnetostatics import (
     CircularWire,
     FiniteStraightWire,
     GeneralWire,
     InfiniteStraightWire,
     MagneticDipole,
+    WireSet,
 )
 
 mu0_4pi = constants.mu0 / 4 / np.pi
@@ -87,6 +89,96 @@ class Test_GeneralWire:
         assert np.all(np.isclose(B_fw.value, B_gw_fw.value))
         assert B_fw.unit == B_gw_fw.unit
 
+    def test_exact_fw(self):
+        "Test that a straight GeneralWire is exact even with a single segment"
+        gw_fw = self.fw.to_GeneralWire()
+        p = np.array([1, 0.5, 0.2])
+        B_fw = self.fw.magnetic_field(p)
+        B_gw_fw = gw_fw.magnetic_field(p, n=1)
+
+        assert np.allclose(B_fw.value, B_gw_fw.value, rtol=1e-12, atol=0)
+
+    @pytest.mark.parametrize(
+        "dparametric_eq", [None, lambda t: np.array([-np.sin(t), np.cos(t), 0 * t])]
+    )
+    def test_gauss(self, dparametric_eq):
+        "Test Gauss-Legendre quadrature against the CircularWire it converted from"
+        gw_cw = GeneralWire(
+            self.cw.curve, -np.pi, np.pi, 1 * u.A, dparametric_eq=dparametric_eq
+        )
+        p = np.array([0.5, 0.2, 0.3])
+        B_cw = self.cw.magnetic_field(p)
+        B_gw_cw = gw_cw.magnetic_field(p, n=100, method="gauss")
+
+        assert np.allclose(B_cw.value, B_gw_cw.value, rtol=1e-8, atol=0)
+
+    def test_gauss_curve_domain(self):
+        "Test that the gauss method only evaluates the curve within [t1, t2]"
+        ts = []
+
+        def curve(t):
+            ts.append(t)
+            return np.array([np.sqrt(t), 0 * t, t])
+
+        dcurve = lambda t: np.array([0.5 / np.sqrt(t), 0 * t, 1 + 0 * t])
+        p = np.array([0.5, 0.5, 0.5])
+        B = GeneralWire(curve, 0, 1, 1 * u.A).magnetic_field(p, n=1000, method="gauss")
+        B_expected = GeneralWire(
+            curve, 0, 1, 1 * u.A, dparametric_eq=dcurve
+        ).magnetic_field(p, n=1000, method="gauss")
+
+        t = np.concatenate(ts)
+        assert np.all((t >= 0) & (t <= 1))
+        assert np.allclose(B.value, B_expected.value, rtol=1e-4)
+
+    def test_method_error(self):
+        "Test GeneralWire raise ValueError for an unknown integration method"
+        gw_fw = self.fw.to_GeneralWire()
+        with pytest.raises(ValueError):
+            gw_fw.magnetic_field([1, 0, 0], method="simpson")
+
+    def test_scalar_parametric_eq(self):
+        "Test a `parametric_eq` that only accepts scalar parameters"
+        gw = GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A)
+        p = np.array([1, 0, 0])
+        B_fw = self.fw.magnetic_field(p)
+        B_gw = gw.magnetic_field(p)
+
+        assert np.all(np.isclose(B_fw.value, B_gw.value))
+        assert B_fw.unit == B_gw.unit
+
+    def test_collinear_point(self):
+        "Test a point on the line through straight segments of the wire"
+        xs, ys = [0, 1, 1, 0, 0], [0, 0, 1, 1, 0]
+        square = lambda t: np.array(
+            [np.interp(t, range(5), xs), np.interp(t, range(5), ys), 0 * t]
+        )
+        fws = [
+            FiniteStraightWire(
+                [xs[i], ys[i], 0] * u.m, [xs[i + 1], ys[i + 1], 0] * u.m, 1 * u.A
+            )
+            for i in range(4)
+        ]
+        p = np.array([2.0, 0, 0])
+        B_expected = sum(fw.magnetic_field(p) for fw in fws[1:])
+        for n in (4, 1000):
+            B = GeneralWire(square, 0, 4, 1 * u.A).magnetic_field(p, n=n)
+            assert np.allclose(B.value, B_expected.value, rtol=1e-12, atol=0)
+
+        gw = GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A)
+        assert np.all(gw.magnetic_field([0, 0, 2.0]).value == 0)
+
+    def test_zero_length_segment(self):
+        "Test a curve that stays at one point over part of its parameter range"
+        curve = lambda t: self.cw.curve(np.clip(t, -np.pi, np.pi))
+        gw = GeneralWire(curve, -np.pi - 0.5, np.pi, 1 * u.A)
+        p = np.array([0.5, 0.2, 0.3])
+        B = gw.magnetic_field(p)
+        B_expected = self.cw.to_GeneralWire().magnetic_field(p)
+
+        assert np.all(np.isfinite(B.value))
+        assert np.allclose(B.value, B_expected.value, rtol=1e-3)
+
     def test_value_error(self):
         "Test GeneralWire raise ValueError when argument t1>t2"
         with pytest.raises(ValueError):
@@ -144,6 +236,68 @@ class Test_InfiniteStraightWire:
         )
 
 
+class Test_WireSet:
+    def setup_method(self):
+        self.fw1 = FiniteStraightWire(
+            np.array([0, 0, -1]) * u.m, np.array([0, 0, 1]) * u.m, 1 * u.A
+        )
+        self.fw2 = FiniteStraightWire(
+            np.array([1, 0, 0]) * u.m, np.array([1, 2, 0]) * u.m, 3 * u.A
+        )
+        self.cw = CircularWire(
+            np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 2 * u.A
+        )
+        self.p = np.array([[0.5, 0.2, 0.3], [2, -1, 0.5]])
+
+    def test_value(self):
+        "Test that the set gives the superposition of its straight wires"
+        ws = WireSet.from_wires([self.fw1, WireSet.from_wires([self.fw2])])
+        B = ws.magnetic_field(self.p)
+        B_expected = self.fw1.magnetic_field(self.p) + self.fw2.magnetic_field(self.p)
+
+        assert np.allclose(B.value, B_expected.value, rtol=1e-12, atol=0)
+        assert B.unit == u.T
+
+    def test_curved_wire(self):
+        "Test that curved wires are split into segments like `GeneralWire`"
+        ws = WireSet.from_wires([self.fw1, self.cw], n=500)
+        B = ws.magnetic_field(self.p)
+        B_expected = self.fw1.magnetic_field(
+            self.p
+        ) + self.cw.to_GeneralWire().magnetic_field(self.p, n=500)
+
+        assert np.allclose(B.value, B_expected.value, rtol=1e-12, atol=0)
+
+    def test_collinear_point(self):
+        "Test that a point on the line through one segment keeps the others"
+        ws = WireSet.from_wires([self.fw1, self.fw2])
+        p = np.array([0, 0, 2.0])
+        B = ws.magnetic_field(p)
+
+        assert np.all(WireSet.from_wires([self.fw1]).magnetic_field(p).value == 0)
+        assert np.allclose(B.value, self.fw2.magnetic_field(p).value, rtol=1e-12)
+
+    def test_shape_error(self):
+        "Test that `WireSet` raises `ValueError` if p1 and p2 do not match"
+        with pytest.raises(ValueError):
+            WireSet(np.zeros((2, 3)) * u.m, np.ones((3, 3)) * u.m, 1 * u.A)
+
+    def test_same_point(self):
+        "Test that `WireSet` raises `ValueError` if a segment has p1 == p2"
+        p1 = np.array([[0, 0, 0], [1, 1, 1]]) * u.m
+        p2 = np.array([[0, 0, 1], [1, 1, 1]]) * u.m
+        with pytest.raises(ValueError):
+            WireSet(p1, p2, 1 * u.A)
+
+    def test_type_error(self):
+        "Test that `WireSet.from_wires` raises `TypeError` for non-wires"
+        iw = InfiniteStraightWire(
+            np.array([0, 1, 0]), np.array([0, 0, 0]) * u.m, 1 * u.A
+        )
+        with pytest.raises(TypeError):
+            WireSet.from_wires([self.fw1, iw])
+
+
 class Test_CircularWire:
     def setup_method(self):
         self.normalz = np.array([0, 0, 1])
@@ -173,6 +327,48 @@ class Test_CircularWire:
         assert np.all(np.isclose(B2.value, B2_expected.value))
         assert B2.unit == u.T
 
+    @pytest.mark.parametrize("normal", [[1, 0, 0], [0, 0, -1]])
+    def test_on_axis(self, normal):
+        "Test that the on-axis closed form agrees with the quadrature"
+        normal = np.array(normal)
+        cw = CircularWire(normal, self.center, self.radius, self.current)
+        cw_quad = CircularWire(normal, self.center, self.radius, self.current)
+        cw_quad._axis_rtol = 0
+        p = np.array([0.5 * normal, [0.5, 0.3, 0.2], -2 * normal, [0, 0, 0]])
+        B = cw.magnetic_field(p)
+        assert np.allclose(B.value, cw_quad.magnetic_field(p).value, rtol=1e-10)
+        for i in range(len(p)):
+            assert np.allclose(B[i].value, cw.magnetic_field(p[i]).value)
+
+    def test_near_axis(self):
+        "Test the closed form just inside the on-axis threshold"
+        cw = CircularWire(self.normalx, self.center, self.radius, self.current)
+        cw_quad = CircularWire(self.normalx, self.center, self.radius, self.current)
+        cw_quad._axis_rtol = 0
+        rho = 0.9 * cw._axis_rtol * np.array([0, 0.6, 0.8])
+        p = np.array([[1, 0, 0], [-0.5, 0, 0], [0, 0, 0]]) + rho
+        B = cw.magnetic_field(p).value
+        B_quad = cw_quad.magnetic_field(p).value
+        atol = 1e-12 * np.linalg.norm(B_quad, axis=-1, keepdims=True)
+        assert np.all(np.abs(B - B_quad) <= atol)
+
+    def test_shared_roots(self):
+        "Test that coils of the same order share read-only quadrature roots"
+        cw1 = CircularWire(self.normalz, self.center, self.radius, self.current)
+        cw2 = CircularWire(self.normalx, self.center, self.radius, self.current)
+        assert cw1.roots_legendre[0] is cw2.roots_legendre[0]
+        with pytest.raises(ValueError):
+            cw1.roots_legendre[1][0] = 0
+
+    def test_curve(self):
+        "Test the parametric equation for scalar and array angles"
+        cw = CircularWire(self.normalz, self.center, self.radius, self.current)
+        t = np.array([0, np.pi / 2, np.pi])
+        pts = cw.curve(t)
+        assert pts.shape == (3, 3)
+        assert np.allclose(pts, [[1, 0, -1], [0, 1, 0], [0, 0, 0]])
+        assert np.allclose(cw.curve(np.pi / 2), [0, 1, 0])
+
     def test_repr(self):
         "Test __repr__ function"
         cw = CircularWire(self.normalz, self.center, self.radius, self.current)
@@ -180,3 +376,148 @@ class Test_CircularWire:
             repr(cw)
             == r"CircularWire(normal=[0. 0. 1.], center=[0. 0. 0.]m, radius=1.0m, current=1.0A)"
         )
+
+
+all_mstats = [
+    MagneticDipole(np.array([0, 0, 1]) * u.A * u.m * u.m, np.array([0, 0, 0]) * u.m),
+    FiniteStraightWire(np.array([0, 0, -1]) * u.m, np.array([0, 0, 1]) * u.m, 1 * u.A),
+    InfiniteStraightWire(np.array([0, 1, 0]), np.array([0, 0, 0]) * u.m, 1 * u.A),
+    CircularWire(np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A),
+    GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A),
+    WireSet(
+        np.array([[0, 0, -1], [0, 0, 1]]) * u.m,
+        np.array([[0, 0, 1], [1, 0, 1]]) * u.m,
+        np.array([1, 2]) * u.A,
+    ),
+]
+
+
+@pytest.mark.parametrize("mstat", all_mstats)
+def test_array_of_points(mstat):
+    "Test that an array of points gives the same field as one point at a time"
+    p = np.array([[[1, 0.5, 0.2], [0.3, 2, -1]], [[-1, -0.2, 0.5], [0.1, 0.4, 3]]])
+    B = mstat.magnetic_field(p)
+    B_expected = np.array([[mstat.magnetic_field(pi).value for pi in row] for row in p])
+
+    assert B.shape == p.shape
+    assert np.allclose(B.value, B_expected)
+    assert B.unit == u.T
+
+
+@pytest.mark.parametrize("mstat", all_mstats)
+def test_points_in_blocks(mstat, monkeypatch):
+    "Test that splitting an array of points into blocks does not change the field"
+    p = np.random.default_rng(0).normal(size=(7, 5, 3))
+    B = mstat.magnetic_field(p)
+    monkeypatch.setattr(magnetostatics, "_BLOCK_SIZE", 1)
+    B_blocks = mstat.magnetic_field(p)
+
+    assert np.allclose(B.value, B_blocks.value, rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("mstat", all_mstats)
+def test_quantity_position(mstat):
+    "Test that a position with units is converted to meters"
+    p = np.array([1, 0.5, 0.2])
+    B = mstat.magnetic_field(p)
+    B_cm = mstat.magnetic_field(p * 100 * u.cm)
+
+    assert np.allclose(B.value, B_cm.value)
+    assert B_cm.unit == u.T
+
+
+@pytest.mark.parametrize(
+    "wire",
+    [
+        CircularWire(np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A),
+        GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A),
+    ],
+)
+def test_float32(wire):
+    "Test that a single precision calculation is close to the double precision one"
+    p = np.array([[1, 0.5, 0.2], [0.3, 2, -1], [-1, -0.2, 0.5]])
+    B = wire.magnetic_field(p)
+    B_32 = wire.magnetic_field(p, dtype=np.float32)
+
+    assert B_32.dtype == np.float32
+    assert np.allclose(B.value, B_32.value, rtol=1e-5, atol=0)
+
+
+@pytest.mark.parametrize(
+    "wire",
+    [
+        CircularWire(np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A),
+        GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A),
+    ],
+)
+def test_magnetic_field_gpu(wire):
+    "Test that the GPU calculation agrees with the CPU one"
+    pytest.importorskip("cupy")
+    p = np.array([[1, 0.5, 0.2], [0.3, 2, -1], [-1, -0.2, 0.5]])
+    B = wire.magnetic_field(p)
+    B_gpu = wire.magnetic_field_gpu(p)
+
+    assert np.allclose(B.value, B_gpu.value)
+    assert B_gpu.unit == u.T
+
+
+class _NumpyAsCupy:
+    """Stand-in for ``cupy`` that runs the GPU code path with `numpy`."""
+
+    asnumpy = staticmethod(np.asarray)
+
+    def __getattr__(self, name):
+        return getattr(np, name)
+
+
+@pytest.mark.parametrize(
+    "wire, kwargs",
+    [
+        (
+            CircularWire(
+                np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A
+            ),
+            {},
+        ),
+        (
+            CircularWire(
+                np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A
+            ),
+            {"dtype": np.float32},
+        ),
+        (GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A), {}),
+        (GeneralWire(lambda t: [0, 0, t], 0, 1, 1 * u.A), {"method": "gauss"}),
+    ],
+)
+def test_magnetic_field_gpu_code_path(wire, kwargs, monkeypatch):
+    "Test the array module dispatch of the GPU methods without a GPU"
+    monkeypatch.setattr(magnetostatics, "_import_cupy", _NumpyAsCupy)
+    # the first and last points are on the axis of the circular wire
+    p = np.array([[0, 0, 0.5], [0.3, 2, -1], [-1, -0.2, 0.5], [0, 0, -2]])
+    B = wire.magnetic_field(p, **kwargs)
+    B_gpu = wire.magnetic_field_gpu(p * u.m, **kwargs)
+    # more points than fit in a GPU block
+    monkeypatch.setattr(magnetostatics, "_GPU_BLOCK_SIZE", 1)
+    B_blocks = wire.magnetic_field_gpu(p * u.m, **kwargs)
+
+    assert B_gpu.dtype == B_blocks.dtype == B.dtype
+    assert np.allclose(B.value, B_gpu.value, rtol=1e-12, atol=0)
+    assert np.allclose(B.value, B_blocks.value, rtol=1e-12, atol=0)
+    assert B_gpu.unit == u.T
+
+
+def test_gpu_block_size(monkeypatch):
+    "Test that points on the GPU are split into blocks of the GPU size"
+    monkeypatch.setattr(magnetostatics, "_BLOCK_SIZE", 1)
+    monkeypatch.setattr(magnetostatics, "_GPU_BLOCK_SIZE", 40)
+    calls = []
+
+    def field(p):
+        calls.append(p.shape)
+        return p
+
+    p = np.arange(60.0).reshape(4, 5, 3)
+    B = magnetostatics._in_blocks(field, p, 10, xp=_NumpyAsCupy())
+
+    assert calls == [(4, 3)] * 5
+    assert np.all(B == p)
@@ -2,6 +2,7 @@
 Useful error messages for optional dependencies that aren't found.
 """
 __all__ = [
+    "cupy_import_error",
     "h5py_import_error",
     "lmfit_import_error",
     "mpl_import_error",
@@ -57,6 +58,11 @@ def _optional_import_error_template(
     return ImportError(template)
 
 
+#: Import error message for `cupy`.
+cupy_import_error = _optional_import_error_template(
+    "cupy", "https://docs.cupy.dev/en/stable/install.html", conda_channel="conda-forge"
+)
+
 #: Import error message for `h5py`.
 h5py_import_error = _optional_import_error_template(
     "h5py", "http://docs.h5py.org/en/latest/build.html"
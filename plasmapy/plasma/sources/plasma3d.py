@@ -4,7 +4,6 @@ Defines the core Plasma class used by PlasmaPy to represent plasma properties.
 __all__ = ["Plasma3D"]
 
 import astropy.units as u
-import itertools
 import numpy as np
 
 from astropy.constants import mu0
@@ -181,14 +180,9 @@ class Plasma3D(GenericPlasma):
         return match
 
     def add_magnetostatic(self, *mstats: MagnetoStatics):
-        # for each MagnetoStatic argument
-        prod = itertools.product(*[list(range(n)) for n in self.domain_shape])
+        # magnetic_field takes an array of points with the vector components
+        # along the last axis, so evaluate each MagnetoStatic on the whole
+        # grid at once
+        p = np.moveaxis(self.grid, 0, -1)
         for mstat in mstats:
-            # loop over 3D-index (ix,iy,iz)
-            for point_index in prod:
-                # get coordinate
-                p = self.grid[(slice(None),) + point_index]  # function as [:, *index]
-                # calculate magnetic field at this point and add back
-                self.magnetic_field[
-                    (slice(None),) + point_index
-                ] += mstat.magnetic_field(p)
+            self._magnetic_field += np.moveaxis(mstat.magnetic_field(p), -1, 0)
@@ -133,6 +133,27 @@ def test_Plasma3D_add_magnetostatics():
     plasma.add_magnetostatic(dipole, cw, gw_cw, iw)
 
 
+def test_Plasma3D_add_magnetostatics_value():
+    r"""Function to test add_magnetostatic sums every source at every point"""
+    dipole = magnetostatics.MagneticDipole(
+        np.array([0, 0, 1]) * u.A * u.m * u.m, np.array([0, 0, 0]) * u.m
+    )
+    iw = magnetostatics.InfiniteStraightWire(
+        np.array([0, 1, 0]), np.array([0, 0, 0]) * u.m, 1 * u.A
+    )
+    plasma = plasma3d.Plasma3D(
+        domain_x=np.linspace(-2, 2, 4) * u.m,
+        domain_y=np.linspace(-1, 1, 3) * u.m,
+        domain_z=np.linspace(-2, 2, 5) * u.m,
+    )
+
+    plasma.add_magnetostatic(dipole, iw)
+
+    p = plasma.grid[:, 1, 2, 3]
+    B_expected = dipole.magnetic_field(p) + iw.magnetic_field(p)
+    assert u.allclose(plasma.magnetic_field[:, 1, 2, 3], B_expected)
+
+
 class Test_PlasmaBlobRegimes:
     def test_intermediate_coupling(self):
         r"""